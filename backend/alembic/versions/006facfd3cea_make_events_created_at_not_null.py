@@ -0,0 +1,39 @@
+"""make events created_at not null
+
+Revision ID: 006facfd3cea
+Revises: c3cfff1a2d40
+Create Date: 2026-10-14 14:08:52.193640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006facfd3cea'
+down_revision: Union[str, None] = 'c3cfff1a2d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE events SET created_at = timezone('utc', now()) WHERE created_at IS NULL")
+    op.alter_column(
+        'events',
+        'created_at',
+        existing_type=sa.DateTime(),
+        nullable=False,
+        server_default=sa.text("timezone('utc', now())")
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'events',
+        'created_at',
+        existing_type=sa.DateTime(),
+        nullable=True,
+        server_default=None
+    )
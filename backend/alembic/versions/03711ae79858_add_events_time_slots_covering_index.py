@@ -0,0 +1,32 @@
+"""add events time slots covering index
+
+Revision ID: 03711ae79858
+Revises: a33277fc8448
+Create Date: 2026-10-14 15:31:09.847256
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '03711ae79858'
+down_revision: Union[str, None] = 'a33277fc8448'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_events_id_time_slots',
+        'events',
+        ['id'],
+        unique=False,
+        postgresql_include=['event_time', 'total_slots', 'available_slots', 'time_slots']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_id_time_slots', table_name='events')
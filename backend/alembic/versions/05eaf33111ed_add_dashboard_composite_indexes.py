@@ -0,0 +1,40 @@
+"""add dashboard composite indexes
+
+Revision ID: 05eaf33111ed
+Revises: e17125f9f826
+Create Date: 2026-10-14 11:20:05.340117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '05eaf33111ed'
+down_revision: Union[str, None] = 'e17125f9f826'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_events_created_by_event_date',
+        'events',
+        ['created_by', 'event_date'],
+        unique=False,
+        postgresql_where=sa.text("status = 'published'")
+    )
+    op.create_index(
+        'ix_bookings_participant_event',
+        'bookings',
+        ['participant_id', 'event_id'],
+        unique=False,
+        postgresql_include=['booking_status']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bookings_participant_event', table_name='bookings')
+    op.drop_index('ix_events_created_by_event_date', table_name='events')
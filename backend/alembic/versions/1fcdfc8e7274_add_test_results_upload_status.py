@@ -0,0 +1,30 @@
+"""add test results upload status
+
+Revision ID: 1fcdfc8e7274
+Revises: d624ef3eadff
+Create Date: 2026-10-14 15:52:37.104926
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1fcdfc8e7274'
+down_revision: Union[str, None] = 'd624ef3eadff'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing results were uploaded synchronously, so they are all complete
+    op.add_column(
+        'test_results',
+        sa.Column('upload_status', sa.String(length=20), nullable=False, server_default='uploaded')
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('test_results', 'upload_status')
@@ -0,0 +1,34 @@
+"""drop events time slots covering index
+
+Revision ID: 3668e7f69f5c
+Revises: 4b7d08f0b7dc
+Create Date: 2026-10-14 16:20:44.390517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3668e7f69f5c'
+down_revision: Union[str, None] = '4b7d08f0b7dc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Bookings rewrite available_slots/time_slots on every claim and release;
+    # indexing them blocks HOT updates, and the endpoint it served is cached
+    op.drop_index('ix_events_id_time_slots', table_name='events')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_events_id_time_slots',
+        'events',
+        ['id'],
+        unique=False,
+        postgresql_include=['event_time', 'total_slots', 'available_slots', 'time_slots']
+    )
@@ -0,0 +1,31 @@
+"""add bookings participant status index
+
+Revision ID: 4b7d08f0b7dc
+Revises: 1fcdfc8e7274
+Create Date: 2026-10-14 16:03:51.662140
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7d08f0b7dc'
+down_revision: Union[str, None] = '1fcdfc8e7274'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_bookings_participant_status',
+        'bookings',
+        ['participant_id', 'booking_status'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bookings_participant_status', table_name='bookings')
@@ -0,0 +1,27 @@
+"""add bookings event_id booked_at index
+
+Revision ID: 817a9636a1ca
+Revises: 12625d129923
+Create Date: 2026-10-14 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '817a9636a1ca'
+down_revision: Union[str, None] = '12625d129923'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Supports booked_at range scans per event (dashboard booking trends)
+    op.create_index('ix_bookings_event_booked_at', 'bookings', ['event_id', 'booked_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bookings_event_booked_at', table_name='bookings')
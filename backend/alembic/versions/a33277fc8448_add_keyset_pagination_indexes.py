@@ -0,0 +1,28 @@
+"""add keyset pagination indexes
+
+Revision ID: a33277fc8448
+Revises: 006facfd3cea
+Create Date: 2026-10-14 14:55:31.604512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a33277fc8448'
+down_revision: Union[str, None] = '006facfd3cea'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_events_event_date_time_id', 'events', ['event_date', 'event_time', 'id'], unique=False)
+    op.create_index('ix_bookings_participant_booked_at_id', 'bookings', ['participant_id', 'booked_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bookings_participant_booked_at_id', table_name='bookings')
+    op.drop_index('ix_events_event_date_time_id', table_name='events')
@@ -0,0 +1,29 @@
+"""add events booked_slots generated column
+
+Revision ID: c3cfff1a2d40
+Revises: d491f155dc8a
+Create Date: 2026-10-14 13:41:26.770384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3cfff1a2d40'
+down_revision: Union[str, None] = 'd491f155dc8a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'events',
+        sa.Column('booked_slots', sa.Integer(), sa.Computed('total_slots - available_slots', persisted=True))
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('events', 'booked_slots')
@@ -0,0 +1,74 @@
+"""count dashboard participants with group by instead of count distinct
+
+Revision ID: d491f155dc8a
+Revises: 05eaf33111ed
+Create Date: 2026-10-14 12:02:48.906615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd491f155dc8a'
+down_revision: Union[str, None] = '05eaf33111ed'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_view(total_participants_sql: str) -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS admin_dashboard_stats")
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW admin_dashboard_stats AS
+        SELECT
+            a.id AS created_by,
+            (
+                SELECT count(*)
+                FROM events e
+                WHERE e.created_by = a.id
+                  AND e.status = 'published'
+                  AND e.event_date >= CURRENT_DATE
+            ) AS active_events,
+            ({total_participants_sql}) AS total_participants,
+            (
+                SELECT count(*)
+                FROM test_results r
+                JOIN bookings b ON b.id = r.booking_id
+                JOIN events e ON e.id = b.event_id
+                WHERE e.created_by = a.id
+            ) AS tests_completed,
+            (
+                SELECT count(*)
+                FROM bookings b
+                JOIN events e ON e.id = b.event_id
+                WHERE e.created_by = a.id
+                  AND b.booked_at >= date_trunc('month', CURRENT_DATE)
+            ) AS bookings_this_month
+        FROM admins a
+    """)
+    op.create_index('ix_admin_dashboard_stats_created_by', 'admin_dashboard_stats', ['created_by'], unique=True)
+
+
+def upgrade() -> None:
+    # GROUP BY plans as a HashAggregate, cheaper than the sort behind count(DISTINCT)
+    _create_view("""
+        SELECT count(*)
+        FROM (
+            SELECT 1
+            FROM bookings b
+            JOIN events e ON e.id = b.event_id
+            WHERE e.created_by = a.id
+            GROUP BY b.participant_id
+        ) AS participants
+    """)
+
+
+def downgrade() -> None:
+    _create_view("""
+        SELECT count(DISTINCT b.participant_id)
+        FROM bookings b
+        JOIN events e ON e.id = b.event_id
+        WHERE e.created_by = a.id
+    """)
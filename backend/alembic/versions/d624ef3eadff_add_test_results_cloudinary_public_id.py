@@ -0,0 +1,33 @@
+"""add test results cloudinary public id
+
+Revision ID: d624ef3eadff
+Revises: 03711ae79858
+Create Date: 2026-10-14 15:40:12.518304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd624ef3eadff'
+down_revision: Union[str, None] = '03711ae79858'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('test_results', sa.Column('cloudinary_public_id', sa.Text(), nullable=True))
+
+    # Backfill from the stored URL the same way the view endpoint used to parse it
+    op.execute("""
+        UPDATE test_results
+        SET cloudinary_public_id = split_part(split_part(result_file_url, '/upload/', 2), '.', 1)
+        WHERE result_file_url LIKE '%/upload/%'
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('test_results', 'cloudinary_public_id')
@@ -0,0 +1,62 @@
+"""create admin_dashboard_stats materialized view
+
+Revision ID: e17125f9f826
+Revises: 817a9636a1ca
+Create Date: 2026-10-14 10:03:17.552931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e17125f9f826'
+down_revision: Union[str, None] = '817a9636a1ca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Per-admin dashboard aggregates, refreshed periodically by the API
+    op.execute("""
+        CREATE MATERIALIZED VIEW admin_dashboard_stats AS
+        SELECT
+            a.id AS created_by,
+            (
+                SELECT count(*)
+                FROM events e
+                WHERE e.created_by = a.id
+                  AND e.status = 'published'
+                  AND e.event_date >= CURRENT_DATE
+            ) AS active_events,
+            (
+                SELECT count(DISTINCT b.participant_id)
+                FROM bookings b
+                JOIN events e ON e.id = b.event_id
+                WHERE e.created_by = a.id
+            ) AS total_participants,
+            (
+                SELECT count(*)
+                FROM test_results r
+                JOIN bookings b ON b.id = r.booking_id
+                JOIN events e ON e.id = b.event_id
+                WHERE e.created_by = a.id
+            ) AS tests_completed,
+            (
+                SELECT count(*)
+                FROM bookings b
+                JOIN events e ON e.id = b.event_id
+                WHERE e.created_by = a.id
+                  AND b.booked_at >= date_trunc('month', CURRENT_DATE)
+            ) AS bookings_this_month
+        FROM admins a
+    """)
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index('ix_admin_dashboard_stats_created_by', 'admin_dashboard_stats', ['created_by'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_admin_dashboard_stats_created_by', table_name='admin_dashboard_stats')
+    op.execute("DROP MATERIALIZED VIEW admin_dashboard_stats")
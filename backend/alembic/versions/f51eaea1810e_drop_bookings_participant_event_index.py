@@ -0,0 +1,34 @@
+"""drop bookings participant event index
+
+Revision ID: f51eaea1810e
+Revises: 3668e7f69f5c
+Create Date: 2026-10-14 15:45:13.469162
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f51eaea1810e'
+down_revision: Union[str, None] = '3668e7f69f5c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # unique_participant_event already indexes (participant_id, event_id),
+    # and ix_bookings_participant_status covers the status lookups
+    op.drop_index('ix_bookings_participant_event', table_name='bookings')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_bookings_participant_event',
+        'bookings',
+        ['participant_id', 'event_id'],
+        unique=False,
+        postgresql_include=['booking_status']
+    )
@@ -5,6 +5,10 @@ from typing import Optional
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    # Connections per worker process; keep
+    # workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW) below Postgres max_connections
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
     
     # JWT
     SECRET_KEY: str
@@ -24,6 +28,12 @@ class Settings(BaseSettings):
     CLOUDINARY_API_KEY: Optional[str] = None
     CLOUDINARY_API_SECRET: Optional[str] = None
     
+    # Redis (response cache, disabled when unset)
+    REDIS_URL: Optional[str] = None
+    
+    # Dashboard
+    DASHBOARD_STATS_REFRESH_SECONDS: int = 120
+    
     # App
     DEBUG: bool = True
     
@@ -6,6 +6,10 @@ from app.config import settings  # No dot, just "app.config"
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,  # Default of 5 queues requests under concurrent load
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=30,
+    pool_recycle=3600,   # Replace connections before server-side idle timeouts drop them
     pool_pre_ping=True,
     echo=settings.DEBUG
 )
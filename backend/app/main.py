@@ -1,15 +1,70 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from app.config import settings
+from app.database import engine
+from app.services.dashboard_service import (
+    acquire_dashboard_refresh_lock,
+    refresh_dashboard_stats,
+    release_dashboard_refresh_lock
+)
+from app.utils.cache import cache
 from app.routers import admin_auth, admin_routes
 from app.routers import participant_auth, participant_routes
 from app.routers import event
 from app.routers import results
 from app.routers import dashboard
 
+logger = logging.getLogger(__name__)
+
+
+async def _refresh_dashboard_stats_periodically():
+    """
+    Keep the admin_dashboard_stats materialized view fresh.
+    
+    Every worker runs this loop, but only the one holding the refresh
+    advisory lock refreshes; the others keep trying to take the lock
+    over in case that worker exits.
+    """
+    lock_conn = None
+    try:
+        while True:
+            await asyncio.sleep(settings.DASHBOARD_STATS_REFRESH_SECONDS)
+            try:
+                if lock_conn is None:
+                    lock_conn = await asyncio.to_thread(acquire_dashboard_refresh_lock, engine)
+                if lock_conn is not None:
+                    await asyncio.to_thread(refresh_dashboard_stats, lock_conn)
+            except Exception as e:
+                logger.error(f"Failed to refresh dashboard stats: {e}")
+                # The lock connection may be broken; start over next time
+                if lock_conn is not None:
+                    release_dashboard_refresh_lock(lock_conn)
+                    lock_conn = None
+    finally:
+        if lock_conn is not None:
+            release_dashboard_refresh_lock(lock_conn)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.REDIS_URL:
+        cache.connect(settings.REDIS_URL)
+    refresh_task = asyncio.create_task(_refresh_dashboard_stats_periodically())
+    yield
+    refresh_task.cancel()
+    cache.close()
+
+
 app = FastAPI(
     title="ROSE Event Management API",
     description="API for ROSE Foundation mobile health screening events",
-
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware (allow frontend to access backend)
@@ -17,8 +72,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Next.js dev server
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers cache preflight responses for 24h
 )
 
 @app.get("/")
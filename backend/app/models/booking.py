@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, UniqueConstraint,Time
+from sqlalchemy import Column, String, DateTime, UniqueConstraint, Index, Time
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy import ForeignKey
@@ -28,6 +28,9 @@ class Booking(Base):
     # Constraint: One participant can only book one slot per event
     __table_args__ = (
         UniqueConstraint('participant_id', 'event_id', name='unique_participant_event'),
+        Index('ix_bookings_event_booked_at', 'event_id', 'booked_at'),
+        Index('ix_bookings_participant_booked_at_id', 'participant_id', 'booked_at', 'id'),
+        Index('ix_bookings_participant_status', 'participant_id', 'booking_status'),
     )
 
     def __repr__(self):
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Date, Time, Text, DateTime, Numeric,JSON
+from sqlalchemy import Column, String, Integer, Date, Time, Text, DateTime, Numeric, JSON, Index, Computed, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy import ForeignKey
@@ -27,15 +27,28 @@ class Event(Base):
     time_slots = Column(JSON, nullable=True)  # Format: [{"start": "09:00", "end": "10:00", "slots": 20, "available": 15}]
     total_slots = Column(Integer, nullable=False)
     available_slots = Column(Integer, nullable=False)
+    booked_slots = Column(Integer, Computed("total_slots - available_slots", persisted=True))
     additional_info = Column(Text)
     status = Column(String(50), default="published", index=True)
     created_by = Column(UUID(as_uuid=True), ForeignKey("admins.id"))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=text("timezone('utc', now())"))
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     creator = relationship("Admin", back_populates="events", foreign_keys=[created_by])
     bookings = relationship("Booking", back_populates="event", cascade="all, delete-orphan")
 
+    # Dashboard queries filter published events by owner and upcoming date
+    __table_args__ = (
+        Index(
+            'ix_events_created_by_event_date',
+            'created_by',
+            'event_date',
+            postgresql_where=text("status = 'published'")
+        ),
+        # Sort/keyset order for the event listing
+        Index('ix_events_event_date_time_id', 'event_date', 'event_time', 'id'),
+    )
+
     def __repr__(self):
         return f"<Event {self.name} on {self.event_date}>"
\ No newline at end of file
@@ -15,6 +15,8 @@ class TestResult(Base):
     result_category = Column(String(50), nullable=False)  # 'Normal', 'Abnormal - follow up required'
     result_notes = Column(Text, nullable=True)
     result_file_url = Column(Text, nullable=True)  # Cloudinary URL
+    cloudinary_public_id = Column(Text, nullable=True)  # Used to sign download URLs
+    upload_status = Column(String(20), nullable=False, default="uploaded", server_default="uploaded")  # 'pending', 'uploaded', 'failed'
     uploaded_by = Column(UUID(as_uuid=True), ForeignKey("admins.id"), nullable=False)
     uploaded_at = Column(DateTime, default=datetime.utcnow)
     sms_sent = Column(Boolean, default=False)
@@ -10,6 +10,7 @@ from app.models.event import Event
 from app.models.booking import Booking
 from app.schemas.admin_schemas import AdminResponse
 from app.schemas.booking import AdminBookingListResponse, AdminBookingResponse
+from app.services.participant_results import invalidate_participant_results
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -119,6 +120,9 @@ def check_in_participant(
             detail=f"Failed to check in participant: {str(e)}"
         )
     
+    # The event now shows up (as pending) on the participant's results page
+    invalidate_participant_results(booking.participant_id)
+    
     return {
         "message": "Participant checked in successfully",
         "booking_id": str(booking.id),
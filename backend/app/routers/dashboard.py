@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy import func, case, cast, literal, null, select, union_all, Date, String
 from datetime import datetime, timedelta
 from typing import List, Dict
 
@@ -11,150 +11,151 @@ from app.models.event import Event, EventStatus
 from app.models.booking import Booking
 from app.models.participant import Participant
 from app.models.test_result import TestResult
+from app.services.dashboard_service import get_admin_dashboard_stats
+from app.utils.cache import cached
 
 router = APIRouter(prefix="/admin/dashboard", tags=["Dashboard"])
 
 
 @router.get("/stats")
+@cached("dashboard", ttl=60)
 def get_dashboard_stats(
     db: Session = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin)
 ):
     """Get dashboard statistics for admin"""
-    
-    # Active Events (published and future)
-    today = datetime.now().date()
-    active_events = db.query(Event).filter(
-        Event.status == EventStatus.published,
-        Event.event_date >= today,
-        Event.created_by == current_admin.id
-    ).count()
-    
-    # Total Participants (unique from bookings)
-    total_participants = db.query(func.count(func.distinct(Booking.participant_id))).filter(
-        Booking.event_id.in_(
-            db.query(Event.id).filter(Event.created_by == current_admin.id)
-        )
-    ).scalar()
-    
-    # Tests Completed
-    tests_completed = db.query(TestResult).join(Booking).join(Event).filter(
-        Event.created_by == current_admin.id
-    ).count()
-    
-    # Bookings This Month
-    current_month = datetime.now().month
-    current_year = datetime.now().year
-    bookings_this_month = db.query(Booking).join(Event).filter(
-        Event.created_by == current_admin.id,
-        extract('month', Booking.booked_at) == current_month,
-        extract('year', Booking.booked_at) == current_year
-    ).count()
-    
-    return {
-        "active_events": active_events,
-        "total_participants": total_participants or 0,
-        "tests_completed": tests_completed,
-        "bookings_this_month": bookings_this_month
-    }
+    return get_admin_dashboard_stats(db, current_admin.id)
 
 
 @router.get("/recent-activity")
+@cached("dashboard", ttl=60)
 def get_recent_activity(
     db: Session = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin),
-    limit: int = 10
+    limit: int = Query(10, ge=1, le=50, description="Number of activities to return")
 ):
     """Get recent activity for admin's events"""
     
-    activities = []
+    no_text = cast(null(), String)
     
     # Recent bookings
     recent_bookings = (
-        db.query(Booking)
+        select(
+            literal("booking").label("type"),
+            Booking.booked_at.label("timestamp"),
+            Booking.id.label("entity_id"),
+            Participant.name.label("participant_name"),
+            Event.name.label("event_name"),
+            no_text.label("result_category")
+        )
+        .select_from(Booking)
         .join(Event)
         .join(Participant)
-        .filter(Event.created_by == current_admin.id)
+        .where(Event.created_by == current_admin.id)
         .order_by(Booking.booked_at.desc())
-        .limit(5)
-        .all()
+        .limit(limit)
     )
     
-    for booking in recent_bookings:
-        activities.append({
-            "type": "booking",
-            "message": f"User {booking.participant.name} booked {booking.event.name}",
-            "timestamp": booking.booked_at.isoformat(),
-            "entity_id": str(booking.id)
-        })
-    
     # Recent results uploaded
     recent_results = (
-        db.query(TestResult)
+        select(
+            literal("result"),
+            TestResult.uploaded_at,
+            TestResult.id,
+            Participant.name,
+            Event.name,
+            TestResult.result_category
+        )
+        .select_from(TestResult)
         .join(Booking)
         .join(Event)
-        .filter(Event.created_by == current_admin.id)
+        .join(Participant, Booking.participant_id == Participant.id)
+        .where(Event.created_by == current_admin.id)
         .order_by(TestResult.uploaded_at.desc())
-        .limit(3)
-        .all()
+        .limit(limit)
     )
     
-    for result in recent_results:
-        activities.append({
-            "type": "result",
-            "message": f"Test result uploaded for {result.booking.participant.name} - {result.result_category}",
-            "timestamp": result.uploaded_at.isoformat(),
-            "entity_id": str(result.id)
-        })
-    
     # Recent events created
     recent_events = (
-        db.query(Event)
-        .filter(Event.created_by == current_admin.id)
+        select(
+            literal("event"),
+            Event.created_at,
+            Event.id,
+            no_text,
+            Event.name,
+            no_text
+        )
+        .where(Event.created_by == current_admin.id)
         .order_by(Event.created_at.desc())
-        .limit(2)
-        .all()
+        .limit(limit)
     )
     
-    for event in recent_events:
-        activities.append({
-            "type": "event",
-            "message": f"New event added: {event.name}",
-            "timestamp": event.created_at.isoformat() if hasattr(event, 'created_at') else datetime.now().isoformat(),
-            "entity_id": str(event.id)
-        })
+    # Each branch only reads its newest `limit` rows; merge, sort and
+    # limit those in the database
+    activity = union_all(recent_bookings, recent_results, recent_events).subquery()
+    rows = db.execute(
+        select(activity)
+        .order_by(activity.c.timestamp.desc())
+        .limit(limit)
+    ).all()
+    
+    messages = {
+        "booking": lambda row: f"User {row.participant_name} booked {row.event_name}",
+        "result": lambda row: f"Test result uploaded for {row.participant_name} - {row.result_category}",
+        "event": lambda row: f"New event added: {row.event_name}",
+    }
     
-    # Sort by timestamp and limit
-    activities.sort(key=lambda x: x["timestamp"], reverse=True)
+    activities = [
+        {
+            "type": row.type,
+            "message": messages[row.type](row),
+            "timestamp": row.timestamp,
+            "entity_id": row.entity_id
+        }
+        for row in rows
+    ]
     
     return {
-        "activities": activities[:limit]
+        "activities": activities
     }
 
 
 @router.get("/booking-trends")
+@cached("dashboard", ttl=60)
 def get_booking_trends(
     db: Session = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin)
 ):
     """Get booking trends for the past 4 weeks"""
     
-    today = datetime.now().date()
+    # booked_at is stored in UTC; the week labels below reuse this same date
+    today = datetime.utcnow().date()
+    
+    # Bucket each booking by how many whole weeks before today it was made
+    week_index = ((literal(today) - cast(Booking.booked_at, Date)) - 1) // 7
+    
+    counts = dict(
+        db.query(week_index.label("week"), func.count(Booking.id))
+        .select_from(Booking)
+        .join(Event)
+        .filter(
+            Event.created_by == current_admin.id,
+            Booking.booked_at >= today - timedelta(days=28),
+            Booking.booked_at < today
+        )
+        .group_by("week")
+        .all()
+    )
+    
     trends = []
     
     for week in range(4):
         week_start = today - timedelta(days=7 * (week + 1))
         week_end = today - timedelta(days=7 * week)
         
-        bookings_count = db.query(Booking).join(Event).filter(
-            Event.created_by == current_admin.id,
-            Booking.booked_at >= week_start,
-            Booking.booked_at < week_end
-        ).count()
-        
         trends.append({
             "week": f"{week + 1} week(s) ago",
-            "count": bookings_count,
+            "count": counts.get(week, 0),
             "week_start": week_start.isoformat(),
             "week_end": week_end.isoformat()
         })
@@ -168,19 +169,32 @@ def get_booking_trends(
 
 
 @router.get("/event-capacity")
+@cached("dashboard", ttl=60)
 def get_event_capacity_overview(
     db: Session = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin)
 ):
     """Get capacity overview for upcoming events"""
     
-    today = datetime.now().date()
+    capacity_percentage = case(
+        (Event.total_slots > 0, Event.booked_slots * 100.0 / Event.total_slots),
+        else_=0
+    )
     
+    # Select only the columns the capacity panel needs
     upcoming_events = (
-        db.query(Event)
+        db.query(
+            Event.id,
+            Event.name,
+            Event.event_date,
+            Event.total_slots,
+            Event.available_slots,
+            Event.booked_slots,
+            func.round(capacity_percentage, 1).label("capacity_percentage")
+        )
         .filter(
             Event.created_by == current_admin.id,
-            Event.event_date >= today,
+            Event.event_date >= func.current_date(),
             Event.status == EventStatus.published
         )
         .order_by(Event.event_date.asc())
@@ -188,20 +202,18 @@ def get_event_capacity_overview(
         .all()
     )
     
-    capacity_data = []
-    for event in upcoming_events:
-        booked_slots = event.total_slots - event.available_slots
-        capacity_percentage = (booked_slots / event.total_slots * 100) if event.total_slots > 0 else 0
-        
-        capacity_data.append({
+    capacity_data = [
+        {
             "event_id": str(event.id),
             "event_name": event.name,
             "event_date": str(event.event_date),
             "total_slots": event.total_slots,
-            "booked_slots": booked_slots,
+            "booked_slots": event.booked_slots,
             "available_slots": event.available_slots,
-            "capacity_percentage": round(capacity_percentage, 1)
-        })
+            "capacity_percentage": float(event.capacity_percentage)
+        }
+        for event in upcoming_events
+    ]
     
     return {
         "events": capacity_data
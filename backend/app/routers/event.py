@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Path
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query
+from typing import Optional
+from uuid import UUID
+from sqlalchemy.orm import Session, joinedload
 from app.database import get_db
 from app.utils.security import get_current_admin
 from app.models.admin import Admin
 from app.schemas.event import EventCreateRequest, EventResponse
 from app.services.event_service import EventService
 from app.models.event import Event  
+from app.utils.cache import cached, invalidate_events_cache, invalidate_dashboard_cache
+from app.services.event_cache import invalidate_event_cache
 
 
 router = APIRouter(prefix="/events", tags=["Events"])
@@ -19,15 +23,25 @@ def create_event(
 ):
     """Create a new event (Draft or Published)."""
     service = EventService(db)
-    return service.create_event(event_data, current_admin.id)
+    event = service.create_event(event_data, current_admin.id)
+    invalidate_events_cache()
+    invalidate_dashboard_cache(current_admin.id)
+    return event
 
 
 # ---------------- LIST EVENTS ----------------
 @router.get("/", response_model=list[EventResponse])
-def list_events(db: Session = Depends(get_db), published_only: bool = True):
+@cached("events", ttl=300)
+def list_events(
+    db: Session = Depends(get_db),
+    published_only: bool = True,
+    after_id: Optional[UUID] = Query(None, description="Last event id of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Page size (all events if omitted)")
+):
     """List all published events (or all if `published_only=False`)."""
     service = EventService(db)
-    return service.list_events(published_only=published_only)
+    events = service.list_events(published_only=published_only, after_id=after_id, limit=limit)
+    return [EventResponse.model_validate(event) for event in events]
 
 
 # ---------------- GET EVENT BY ID ----------------
@@ -48,7 +62,11 @@ def edit_event(
 ):
     """Edit an existing event (admin only)."""
     service = EventService(db)
-    return service.update_event(event_id, event_data, current_admin.id)
+    event = service.update_event(event_id, event_data, current_admin.id)
+    invalidate_event_cache(event.id)
+    invalidate_events_cache()
+    invalidate_dashboard_cache(current_admin.id)
+    return event
 
 
 # ---------------- DELETE EVENT ----------------
@@ -60,7 +78,11 @@ def delete_event(
 ):
     """Delete an event (admin only)."""
     service = EventService(db)
-    return service.delete_event(event_id, current_admin.id)
+    result = service.delete_event(event_id, current_admin.id)
+    invalidate_event_cache(event_id)
+    invalidate_events_cache()
+    invalidate_dashboard_cache(current_admin.id)
+    return result
 
 
 # ---------------- GET EVENT PARTICIPANTS (ADMIN ONLY) ----------------
@@ -79,16 +101,21 @@ def get_event_participants(
         raise HTTPException(status_code=404, detail="Event not found")
     
     # Get bookings for this event
-    bookings = db.query(Booking).filter(Booking.event_id == event_id).all()
+    bookings = (
+        db.query(Booking)
+        .options(joinedload(Booking.participant))
+        .filter(Booking.event_id == event_id)
+        .all()
+    )
     
     # Format participant data with booking info
     participants = [
         {
-            "id": str(booking.id),  # ✅ This is the booking ID (what we need!)
-            "booking_id": str(booking.id),  # ✅ Explicit booking_id field
+            "id": booking.id,  # ✅ This is the booking ID (what we need!)
+            "booking_id": booking.id,  # ✅ Explicit booking_id field
             "booking_reference": booking.booking_reference,
             "booking_status": booking.booking_status,
-            "booked_at": booking.booked_at.isoformat(),
+            "booked_at": booking.booked_at,
             "name": booking.participant.name,
             "phone_number": booking.participant.phone_number,
             "mykad_id": booking.participant.mykad_id,
@@ -98,10 +125,10 @@ def get_event_participants(
     
     return {
         "event": {
-            "id": str(event.id),
+            "id": event.id,
             "name": event.name,
-            "event_date": str(event.event_date),
-            "event_time": str(event.event_time),
+            "event_date": event.event_date,
+            "event_time": event.event_time,
             "address": event.address,
             "total_slots": event.total_slots,
             "available_slots": event.available_slots,
@@ -128,47 +155,63 @@ def export_event_participants(
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    # Get bookings for this event
-    bookings = db.query(Booking).filter(Booking.event_id == event_id).all()
+    # Stream bookings from a server-side cursor, 500 rows at a time
+    bookings = (
+        db.query(Booking)
+        .options(joinedload(Booking.participant))
+        .filter(Booking.event_id == event_id)
+        .execution_options(stream_results=True)
+        .yield_per(500)
+    )
 
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Write header
-    writer.writerow([
-        "Booking Reference", 
-        "Booking Status", 
-        "Booked At", 
-        "Name", 
-        "Phone Number", 
-        "MyKad ID"
-    ])
-
-    # Write data
-    for booking in bookings:
+    def generate_csv():
+        # Reuse one small buffer so only the current row is held in memory
+        output = io.StringIO()
+        writer = csv.writer(output)
+
+        def flush():
+            line = output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+            return line
+
+        # Write header
         writer.writerow([
-            booking.booking_reference,
-            booking.booking_status,
-            booking.booked_at.strftime("%Y-%m-%d %H:%M:%S"),
-            booking.participant.name,
-            booking.participant.phone_number,
-            booking.participant.mykad_id,
+            "Booking Reference", 
+            "Booking Status", 
+            "Booked At", 
+            "Name", 
+            "Phone Number", 
+            "MyKad ID"
         ])
-    
-    output.seek(0)
-    
-    response = StreamingResponse(
-        iter([output.getvalue()]), 
-        media_type="text/csv"
-    )
+        yield flush()
+
+        # Write data
+        for booking in bookings:
+            writer.writerow([
+                booking.booking_reference,
+                booking.booking_status,
+                booking.booked_at.strftime("%Y-%m-%d %H:%M:%S"),
+                booking.participant.name,
+                booking.participant.phone_number,
+                booking.participant.mykad_id,
+            ])
+            yield flush()
+
+    response = StreamingResponse(generate_csv(), media_type="text/csv")
     response.headers["Content-Disposition"] = f"attachment; filename=participants_{event_id}.csv"
     return response
 
 @router.get("/{event_id}/time-slots")
+@cached("events", ttl=300)
 def get_event_time_slots(event_id: str, db: Session = Depends(get_db)):
     """Get available time slots for an event"""
-    event = db.query(Event).filter(Event.id == event_id).first()
+    # Only the slot columns, looked up by primary key
+    event = (
+        db.query(Event.time_slots, Event.event_time, Event.total_slots, Event.available_slots)
+        .filter(Event.id == event_id)
+        .first()
+    )
     
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+import logging
 from sqlalchemy.orm import Session
 from app.schemas.participant_schemas import (
     ParticipantRegisterRequest, 
@@ -13,8 +14,10 @@ from app.utils.security import create_access_token
 from app.database import get_db
 from app.services.otp_service import create_otp_record, verify_otp, invalidate_previous_otps
 from app.services.sms_service import send_otp_sms
+from app.services.participant_results import prefetch_participant_results
 
 router = APIRouter(prefix="/participant/auth", tags=["Participant Authentication"])
+logger = logging.getLogger(__name__)
 
 
 @router.post("/register", response_model=OTPResponse)
@@ -46,7 +49,7 @@ def register_participant(request: ParticipantRegisterRequest, db: Session = Depe
         mock=True
     )
     
-    print(f"📱 OTP sent to {request.phone_number}: {otp_record.otp_code}")
+    logger.debug("OTP sent to %s", request.phone_number)
     
     return OTPResponse(
         message=f"OTP sent to {request.phone_number}. Valid for 10 minutes.",
@@ -122,7 +125,7 @@ def login_participant(request: ParticipantLoginRequest, db: Session = Depends(ge
         mock=True
     )
     
-    print(f"📱 OTP sent to {request.phone_number}: {otp_record.otp_code}")
+    logger.debug("OTP sent to %s", request.phone_number)
     
     return OTPResponse(
         message=f"OTP sent to {request.phone_number}. Valid for 10 minutes.",
@@ -131,7 +134,11 @@ def login_participant(request: ParticipantLoginRequest, db: Session = Depends(ge
 
 
 @router.post("/verify-login", response_model=TokenResponse)
-def verify_login(request: VerifyOTPRequest, db: Session = Depends(get_db)):
+def verify_login(
+    request: VerifyOTPRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """Step 2 of login: Verify OTP and return JWT token"""
     
     is_valid = verify_otp(
@@ -156,6 +163,9 @@ def verify_login(request: VerifyOTPRequest, db: Session = Depends(get_db)):
         "role": "participant"
     })
     
+    # Warm the cache for the results page, which usually comes next
+    background_tasks.add_task(prefetch_participant_results, participant.id)
+    
     return TokenResponse(
         access_token=access_token,
         user={
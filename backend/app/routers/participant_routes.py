@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
-from typing import List
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import List, Optional
+from uuid import UUID
+from pydantic import TypeAdapter
 from app.database import get_db
 from app.models.booking import Booking
 from app.models.participant import Participant
-from app.schemas.event import EventResponse
 from app.utils.security import get_current_participant
 from app.schemas.booking import (
     CreateBookingRequest,
@@ -14,9 +16,13 @@ from app.schemas.booking import (
 )
 from app.schemas.participant_schemas import ParticipantResponse
 from app.services.booking_service import create_booking, cancel_booking
+from app.utils.cache import invalidate_events_cache, invalidate_dashboard_cache
 
 router = APIRouter(prefix="/participant", tags=["Participant"])
 
+# Built once at import so the list validator is not rebuilt per request
+booking_list_adapter = TypeAdapter(List[BookingResponse])
+
 
 @router.get("/profile", response_model=ParticipantResponse)
 def get_profile(current_user: Participant = Depends(get_current_participant)):
@@ -26,23 +32,31 @@ def get_profile(current_user: Participant = Depends(get_current_participant)):
 @router.get("/bookings", response_model=List[BookingResponse])
 def get_my_bookings(
     db: Session = Depends(get_db),
-    current_user: Participant = Depends(get_current_participant)
+    current_user: Participant = Depends(get_current_participant),
+    after_id: Optional[UUID] = Query(None, description="Last booking id of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Page size (all bookings if omitted)")
 ):
-    bookings = db.query(Booking).options(joinedload(Booking.event)).filter(
+    # selectinload fetches each distinct event once instead of repeating it per booking row
+    query = db.query(Booking).options(selectinload(Booking.event)).filter(
         Booking.participant_id == current_user.id
-    ).all()
+    )
+
+    # Keyset pagination, newest bookings first
+    if after_id:
+        cursor = db.query(Booking.booked_at, Booking.id).filter(
+            Booking.id == after_id,
+            Booking.participant_id == current_user.id
+        ).first()
+        if not cursor:
+            raise HTTPException(status_code=400, detail="Invalid after_id cursor")
+        query = query.filter(tuple_(Booking.booked_at, Booking.id) < tuple_(*cursor))
+
+    query = query.order_by(Booking.booked_at.desc(), Booking.id.desc())
+    if limit:
+        query = query.limit(limit)
+    bookings = query.all()
 
-    return [
-        BookingResponse(
-            id=str(b.id),
-            booking_reference=b.booking_reference,
-            booking_status=b.booking_status,
-            booked_at=b.booked_at,
-            cancelled_at=b.cancelled_at,
-            event=EventResponse.from_orm(b.event).model_dump()
-        )
-        for b in bookings
-    ]
+    return booking_list_adapter.validate_python(bookings, from_attributes=True)
 
 
 # ----------------------------
@@ -51,6 +65,7 @@ def get_my_bookings(
 @router.post("/bookings", response_model=BookingWithEventResponse)
 def book_event(
     request: CreateBookingRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: Participant = Depends(get_current_participant)
 ):
@@ -61,24 +76,20 @@ def book_event(
         participant_phone=current_user.phone_number,
         event_id=request.event_id,
         time_slot_start=request.time_slot_start,
-        time_slot_end=request.time_slot_end
+        time_slot_end=request.time_slot_end,
+        background_tasks=background_tasks
     )
     
     # Load event relationship
     booking = db.query(Booking).options(joinedload(Booking.event)).filter_by(id=booking.id).first()
     
-    booking_data = BookingResponse(
-        id=booking.id,
-        booking_reference=booking.booking_reference,
-        booking_status=booking.booking_status,
-        booked_at=booking.booked_at,
-        cancelled_at=booking.cancelled_at,
-        time_slot_start=booking.time_slot_start,
-        time_slot_end=booking.time_slot_end,
-        event=EventResponse.from_orm(booking.event).model_dump()
-    )
+    invalidate_events_cache()
+    invalidate_dashboard_cache(booking.event.created_by)
     
-    return BookingWithEventResponse(booking=booking_data, message="Booking confirmed.")
+    return BookingWithEventResponse(
+        booking=BookingResponse.model_validate(booking),
+        message="Booking confirmed."
+    )
 
 
 # ----------------------------
@@ -87,6 +98,7 @@ def book_event(
 @router.post("/bookings/{booking_id}/cancel", response_model=CancelBookingResponse)
 def cancel_my_booking(
     booking_id: str,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: Participant = Depends(get_current_participant)
 ):
@@ -94,9 +106,13 @@ def cancel_my_booking(
     booking = cancel_booking(
         db,
         booking_id,
-        participant_phone=current_user.phone_number  # <-- Add phone number here
+        participant_phone=current_user.phone_number,  # <-- Add phone number here
+        background_tasks=background_tasks
     )
 
+    invalidate_events_cache()
+    invalidate_dashboard_cache(booking.event.created_by)
+
     if booking.participant_id != current_user.id:
         raise HTTPException(status_code=403, detail="Cannot cancel a booking that is not yours")
 
@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, UploadFile, File, status
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import shutil
+import tempfile
+from typing import BinaryIO, List, Optional
+from datetime import datetime, timedelta
 from uuid import UUID
 
-from app.database import get_db
+from app.database import get_db, SessionLocal
 from app.models.admin import Admin
 from app.models.participant import Participant
 from app.models.booking import Booking
@@ -15,6 +21,8 @@ from app.schemas.result import (
     ResultListResponse,
     SendResultSMSRequest,
     SendResultSMSResponse,
+    SendResultSMSBatchRequest,
+    SendResultSMSBatchResponse,
     ParticipantResultResponse,
     RequestResultOTPResponse,
     ViewResultResponse
@@ -23,16 +31,100 @@ from app.utils.security import get_current_admin, get_current_participant
 from app.services.file_upload_service import file_upload_service
 from app.services.sms_service import send_result_notification_sms
 from app.services.otp_service import create_otp_record, verify_otp
+from app.services.event_cache import get_or_cache_event
+from app.services.participant_results import (
+    list_participant_results,
+    cache_participant_results,
+    get_prefetched_results,
+    invalidate_participant_results
+)
+from app.utils.cache import cache
 from pydantic import BaseModel
 
 router = APIRouter(tags=["Results"])
+logger = logging.getLogger(__name__)
+
+# Seconds a result SMS send is locked against duplicates (e.g. double clicks)
+RESULT_SMS_LOCK_TTL = 60
+
+# Minimum seconds between result OTP requests from the same phone
+OTP_REQUEST_THROTTLE = 30
+
+# Concurrent SMS sends in a batch (kept within the provider's rate limit)
+SMS_BATCH_CONCURRENCY = 20
+
+# Link included in result notifications
+RESULT_URL_TEMPLATE = "https://rose.org/results/{result_id}"  # Update with actual URL
 
 class VerifyOTPRequest(BaseModel):
     otp_code: str
 
 # ADMIN ROUTES
-@router.post("/admin/results", response_model=ResultResponse)
-async def upload_result(
+# Uploads larger than this spill from memory to a temporary file on disk
+UPLOAD_SPOOL_MAX_SIZE = 1024 * 1024
+
+# A result still "pending" after this long lost its background job (e.g. a
+# worker restart) and may be uploaded again
+UPLOAD_STALE_AFTER = timedelta(minutes=15)
+
+
+def _upload_and_update(
+    result_id: UUID,
+    started_at: datetime,
+    file: BinaryIO,
+    booking_id: str,
+    participant_id: UUID,
+    filename: str
+):
+    """
+    Background job: push the PDF to Cloudinary and record the outcome.
+    Runs after the response is sent, so it opens its own session.
+    
+    Only the upload that is still current (same uploaded_at) is recorded,
+    so a job that finishes after a stale re-upload can't overwrite it.
+    """
+    db = SessionLocal()
+    try:
+        result = db.query(TestResult).filter(
+            TestResult.id == result_id,
+            TestResult.upload_status == "pending",
+            TestResult.uploaded_at == started_at
+        )
+        try:
+            file_url, public_id = file_upload_service.upload_result_pdf(
+                file=file,
+                booking_id=booking_id,
+                filename=filename
+            )
+        except Exception:
+            logger.exception(f"Result upload failed for booking {booking_id}")
+            result.update({"upload_status": "failed"})
+        else:
+            result.update({
+                "result_file_url": file_url,
+                "cloudinary_public_id": public_id,
+                "upload_status": "uploaded"
+            })
+        db.commit()
+        invalidate_participant_results(participant_id)
+    finally:
+        file.close()
+        db.close()
+
+
+def _can_reupload(result: TestResult) -> bool:
+    """True if a result's file never made it to Cloudinary"""
+    if result.upload_status == "failed":
+        return True
+    return (
+        result.upload_status == "pending"
+        and result.uploaded_at < datetime.utcnow() - UPLOAD_STALE_AFTER
+    )
+
+
+@router.post("/admin/results", response_model=ResultResponse, status_code=status.HTTP_202_ACCEPTED)
+def upload_result(
+    background_tasks: BackgroundTasks,
     booking_id: str = File(...),
     result_category: str = File(...),
     result_notes: str = File(None),
@@ -43,52 +135,80 @@ async def upload_result(
     """
     Admin uploads test result for a participant.
     Only checked-in participants can receive results.
+    
+    The result is saved with upload_status "pending" and the PDF is
+    pushed to Cloudinary in the background; the status becomes
+    "uploaded" (or "failed") once it finishes. Failed uploads, and
+    uploads stuck in "pending", may be uploaded again.
     """
     
-    # Verify booking exists and is checked-in
-    booking = db.query(Booking).filter(Booking.id == booking_id).first()
+    # Fetch the booking and any existing result in one round trip
+    row = (
+        db.query(Booking, TestResult)
+        .outerjoin(TestResult, TestResult.booking_id == Booking.id)
+        .filter(Booking.id == booking_id)
+        .first()
+    )
     
-    if not booking:
+    # Verify booking exists and is checked-in
+    if not row:
         raise HTTPException(status_code=404, detail="Booking not found")
     
+    booking, existing_result = row
+    
     if booking.booking_status != "checked_in":
         raise HTTPException(
             status_code=400,
             detail="Cannot upload result for participant who hasn't checked in"
         )
     
-    # Check if result already exists for this booking
-    existing_result = db.query(TestResult).filter(
-        TestResult.booking_id == booking_id
-    ).first()
-    
-    if existing_result:
+    # Check if result already exists for this booking (failed or stuck uploads may be retried)
+    if existing_result and not _can_reupload(existing_result):
         raise HTTPException(
             status_code=400,
             detail="Result already uploaded for this booking"
         )
     
-    # Upload PDF to Cloudinary
-    file_content = await file.read()
-    file_url = file_upload_service.upload_result_pdf(
-        file_content=file_content,
-        booking_id=booking_id,
-        filename=file.filename or "result.pdf"
-    )
-    
-    # Create result record
-    test_result = TestResult(
-        booking_id=booking_id,
-        result_category=result_category,
-        result_notes=result_notes,
-        result_file_url=file_url,
-        uploaded_by=current_admin.id,
-        sms_sent=False
-    )
+    # Create (or reset) the result record; the file follows in the background
+    test_result = existing_result or TestResult(booking_id=booking_id)
+    test_result.result_category = result_category
+    test_result.result_notes = result_notes
+    test_result.result_file_url = None
+    test_result.cloudinary_public_id = None
+    test_result.upload_status = "pending"
+    test_result.uploaded_by = current_admin.id
+    test_result.uploaded_at = datetime.utcnow()
+    test_result.sms_sent = False
     
     db.add(test_result)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent upload created the result first (booking_id is unique)
+        db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail="Result already uploaded for this booking"
+        )
     db.refresh(test_result)
+    invalidate_participant_results(booking.participant_id)
+    
+    # The request's upload file is closed once the response is sent,
+    # so hand the background job its own spooled copy
+    spool = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_SIZE)
+    shutil.copyfileobj(file.file, spool)
+    spool.seek(0)
+    
+    # Upload PDF to Cloudinary after the response is sent
+    background_tasks.add_task(
+        _upload_and_update,
+        test_result.id,
+        test_result.uploaded_at,
+        spool,
+        booking_id,
+        booking.participant_id,
+        file.filename or "result.pdf"
+    )
     
     return test_result
 
@@ -103,8 +223,29 @@ def send_result_sms(
     Admin sends SMS notification when result is ready.
     """
     
-    # Get result with related booking and participant
-    result = db.query(TestResult).filter(TestResult.id == result_id).first()
+    # Only one send per result may be in flight
+    lock_key = f"result_sms:{result_id}"
+    if not cache.acquire_lock(lock_key, RESULT_SMS_LOCK_TTL):
+        raise HTTPException(
+            status_code=409,
+            detail="SMS for this result is already being sent"
+        )
+    
+    try:
+        return _send_result_sms(db, result_id)
+    finally:
+        cache.delete(lock_key)
+
+
+def _send_result_sms(db: Session, result_id: UUID) -> SendResultSMSResponse:
+    """Send the result SMS and mark it sent, holding a row lock throughout"""
+    
+    # Get result with related booking and participant, locking the result row
+    result = db.query(TestResult).options(
+        joinedload(TestResult.booking).joinedload(Booking.participant)
+    ).filter(
+        TestResult.id == result_id
+    ).with_for_update(of=TestResult).first()
     
     if not result:
         raise HTTPException(status_code=404, detail="Result not found")
@@ -115,6 +256,12 @@ def send_result_sms(
             detail="SMS already sent for this result"
         )
     
+    if result.upload_status != "uploaded":
+        raise HTTPException(
+            status_code=400,
+            detail="Result file has not finished uploading"
+        )
+    
     # Get booking and participant info
     booking = result.booking
     participant = booking.participant
@@ -125,7 +272,7 @@ def send_result_sms(
         result_category=result.result_category,
         booking_reference=booking.booking_reference,
         participant_name=participant.name,
-        result_url=f"https://rose.org/results/{result.id}",  # Update with actual URL
+        result_url=RESULT_URL_TEMPLATE.format(result_id=result.id),
         mock=True
     )
     
@@ -140,19 +287,98 @@ def send_result_sms(
     )
 
 
+@router.post("/admin/results/send-sms-batch", response_model=SendResultSMSBatchResponse)
+def send_result_sms_batch(
+    request: SendResultSMSBatchRequest,
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Admin sends SMS notifications for several results at once.
+    Results already notified, still uploading, or being sent by
+    another request are skipped.
+    """
+    
+    # Load and lock every sendable result with its booking and participant in one query
+    results = db.query(TestResult).options(
+        joinedload(TestResult.booking).joinedload(Booking.participant)
+    ).filter(
+        TestResult.id.in_(request.result_ids),
+        TestResult.sms_sent == False,
+        TestResult.upload_status == "uploaded"
+    ).with_for_update(of=TestResult, skip_locked=True).all()
+    
+    # Build every message's arguments up front so the workers only do network I/O
+    messages = [
+        (result.id, {
+            "phone": result.booking.participant.phone_number,
+            "result_category": result.result_category,
+            "booking_reference": result.booking.booking_reference,
+            "participant_name": result.booking.participant.name,
+            "result_url": RESULT_URL_TEMPLATE.format(result_id=result.id),
+            "mock": True
+        })
+        for result in results
+    ]
+    
+    def send(message):
+        result_id, sms_args = message
+        # One failed send must not stop the others from being marked as sent
+        try:
+            return result_id, send_result_notification_sms(**sms_args)
+        except Exception:
+            logger.exception(f"Result SMS failed for result {result_id}")
+            return result_id, None
+    
+    with ThreadPoolExecutor(max_workers=SMS_BATCH_CONCURRENCY) as executor:
+        outcomes = list(executor.map(send, messages))
+    
+    # Mark everything that went out in a single UPDATE round trip
+    sent_at = datetime.utcnow()
+    sent_ids = [result_id for result_id, sid in outcomes if sid]
+    db.bulk_update_mappings(TestResult, [
+        {"id": result_id, "sms_sent": True, "sms_sent_at": sent_at}
+        for result_id in sent_ids
+    ])
+    db.commit()
+    
+    requested = len(set(request.result_ids))
+    
+    return SendResultSMSBatchResponse(
+        message=f"Result notifications sent to {len(sent_ids)} participant(s)",
+        sent=len(sent_ids),
+        skipped=requested - len(sent_ids)
+    )
+
+
 @router.get("/admin/results", response_model=ResultListResponse)
 def get_all_results(
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Page size (all results if omitted)"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
     db: Session = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin)
 ):
     """
-    Admin views all test results.
+    Admin views all test results, newest first.
+    Pass `limit` (and `offset`) to fetch one page at a time;
+    `total` is the count across all pages.
     """
-    results = db.query(TestResult).order_by(TestResult.uploaded_at.desc()).all()
+    query = (
+        db.query(TestResult)
+        .order_by(TestResult.uploaded_at.desc(), TestResult.id.desc())
+        .offset(offset)
+    )
+    
+    # The admin results page doesn't paginate yet, so paging is opt-in
+    if limit:
+        query = query.limit(limit)
+    
+    results = query.all()
+    total = db.query(func.count(TestResult.id)).scalar()
     
     return ResultListResponse(
         results=results,
-        total=len(results)
+        total=total
     )
 
 
@@ -167,39 +393,13 @@ def get_my_results(
     Shows results pending for attended events without processed results.
     """
     
-    # Get all bookings for this participant
-    bookings = db.query(Booking).filter(
-        Booking.participant_id == current_participant.id,
-        Booking.booking_status == "checked_in"  # Only attended events
-    ).all()
-    
-    results = []
-    
-    for booking in bookings:
-        if booking.test_result:
-            # Result available
-            results.append(
-                ParticipantResultResponse(
-                    id=str(booking.test_result.id),
-                    event_name=booking.event.name,
-                    event_date=str(booking.event.event_date),
-                    result_category=booking.test_result.result_category,
-                    result_available=True,
-                    uploaded_at=booking.test_result.uploaded_at
-                )
-            )
-        else:
-            # Result pending
-            results.append(
-                ParticipantResultResponse(
-                    id=str(booking.id),
-                    event_name=booking.event.name,
-                    event_date=str(booking.event.event_date),
-                    result_category="Pending",
-                    result_available=False,
-                    uploaded_at=booking.booked_at
-                )
-            )
+    # Served straight from Redis when prefetched at login (or viewed recently)
+    prefetched = get_prefetched_results(current_participant.id)
+    if prefetched is not None:
+        return Response(content=prefetched, media_type="application/json")
+    
+    results = list_participant_results(db, current_participant.id)
+    cache_participant_results(current_participant.id, results)
     
     return results
 
@@ -223,6 +423,16 @@ def request_result_otp(
     if result.booking.participant_id != current_participant.id:
         raise HTTPException(status_code=403, detail="Access denied")
     
+    if result.upload_status != "uploaded":
+        raise HTTPException(status_code=400, detail="Result is not available yet")
+    
+    # Throttle bursts of OTP requests
+    if not cache.acquire_lock(f"otp_req:{current_participant.phone_number}", OTP_REQUEST_THROTTLE):
+        raise HTTPException(
+            status_code=429,
+            detail="Please wait before requesting another OTP"
+        )
+    
     # Generate OTP
     from app.services.otp_service import invalidate_previous_otps
     
@@ -243,7 +453,7 @@ def request_result_otp(
         mock=True
     )
     
-    print(f"OTP sent to {current_participant.phone_number}: {otp_record.otp_code}")
+    logger.debug("OTP sent to %s", current_participant.phone_number)
     
     return RequestResultOTPResponse(
         message=f"OTP sent to {current_participant.phone_number} to verify identity",
@@ -270,6 +480,9 @@ def view_result_with_otp(
     if result.booking.participant_id != current_participant.id:
         raise HTTPException(status_code=403, detail="Access denied")
     
+    if result.upload_status != "uploaded":
+        raise HTTPException(status_code=400, detail="Result is not available yet")
+    
     # Verify OTP
     is_valid = verify_otp(
         db=db,
@@ -283,20 +496,19 @@ def view_result_with_otp(
     
     # Generate time-limited signed URL for PDF (1 hour validity)
     secure_url = None
-    if result.result_file_url:
-        url_parts = result.result_file_url.split('/upload/')
-        if len(url_parts) > 1:
-            public_id = url_parts[1].split('.')[0]
-            secure_url = file_upload_service.generate_signed_url(public_id, expires_in_hours=1)
-        else:
-            secure_url = result.result_file_url
+    if result.cloudinary_public_id:
+        secure_url = file_upload_service.generate_signed_url(result.cloudinary_public_id, expires_in_hours=1)
+    elif result.result_file_url:
+        secure_url = result.result_file_url
+    
+    event = get_or_cache_event(db, result.booking.event_id)
     
     return ViewResultResponse(
         result_category=result.result_category,
         result_notes=result.result_notes,
         result_file_url=secure_url,
-        event_name=result.booking.event.name,
-        event_date=str(result.booking.event.event_date)
+        event_name=event["name"],
+        event_date=event["event_date"]
     )
 
 
@@ -3,6 +3,8 @@ from typing import Optional
 from datetime import datetime, time
 from uuid import UUID
 
+from app.schemas.event import EventResponse
+
 # BOOKING SCHEMAS
 class CreateBookingRequest(BaseModel):
     """Request schema for creating a booking"""
@@ -29,7 +31,7 @@ class BookingResponse(BaseModel):
     cancelled_at: Optional[datetime] = None
     time_slot_start: Optional[time] = None
     time_slot_end: Optional[time] = None
-    event: dict
+    event: EventResponse
 
     class Config:
         from_attributes = True
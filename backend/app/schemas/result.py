@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, field_serializer
 from typing import Optional
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
 
@@ -27,6 +27,7 @@ class ResultResponse(BaseModel):
     result_category: str
     result_notes: Optional[str]
     result_file_url: Optional[str]
+    upload_status: str
     uploaded_by: UUID
     uploaded_at: datetime
     sms_sent: bool
@@ -46,6 +47,7 @@ class ResultResponse(BaseModel):
                 "result_category": "Normal",
                 "result_notes": "HPV test negative",
                 "result_file_url": "https://res.cloudinary.com/...",
+                "upload_status": "uploaded",
                 "uploaded_by": "admin-uuid",
                 "uploaded_at": "2025-11-18T10:00:00",
                 "sms_sent": True,
@@ -86,16 +88,48 @@ class SendResultSMSResponse(BaseModel):
         }
 
 
+class SendResultSMSBatchRequest(BaseModel):
+    """Request to send result notification SMS for several results"""
+    result_ids: list[UUID] = Field(..., min_length=1, max_length=500)
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "result_ids": [
+                    "123e4567-e89b-12d3-a456-426614174000",
+                    "223e4567-e89b-12d3-a456-426614174000"
+                ]
+            }
+        }
+
+
+class SendResultSMSBatchResponse(BaseModel):
+    """Response after sending a batch of result SMS"""
+    message: str
+    sent: int
+    skipped: int
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "message": "Result notifications sent to 2 participant(s)",
+                "sent": 2,
+                "skipped": 0
+            }
+        }
+
+
 class ParticipantResultResponse(BaseModel):
     """Participant view of their result (limited fields)"""
-    id: str
+    id: UUID
     event_name: str
-    event_date: str
+    event_date: date
     result_category: str
     result_available: bool
     uploaded_at: datetime
     
     class Config:
+        from_attributes = True
         json_schema_extra = {
             "example": {
                 "id": "123e4567-e89b-12d3-a456-426614174000",
@@ -1,10 +1,12 @@
+from sqlalchemy import and_, text, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from app.models.booking import Booking
 from app.models.event import Event
 from app.models.participant import Participant
 from datetime import datetime, time as dt_time
-import random
+import secrets
 import string
 from app.services.sms_service import send_booking_confirmation_sms, send_booking_cancellation_sms
 
@@ -12,33 +14,118 @@ from app.services.sms_service import send_booking_confirmation_sms, send_booking
 def generate_booking_reference() -> str:
     """Generate unique booking reference"""
     prefix = "ROSE"
-    suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+    suffix = ''.join(secrets.choice(string.ascii_uppercase + string.digits) for _ in range(6))
     return f"{prefix}-{suffix}"
 
 
+# Attempts at drawing an unused booking reference before giving up
+BOOKING_REFERENCE_ATTEMPTS = 3
+
+
+def _is_reference_collision(error: IntegrityError) -> bool:
+    """True if the insert failed on the unique booking_reference index"""
+    diag = getattr(error.orig, "diag", None)
+    return getattr(diag, "constraint_name", None) == "ix_bookings_booking_reference"
+
+
+# Adjust one slot's availability in place; the WHERE clause makes it a no-op
+# (rowcount 0) when the slot is missing or would drop below zero
+_ADJUST_TIME_SLOT_SQL = text("""
+    UPDATE events
+    SET time_slots = (
+        SELECT jsonb_agg(
+            CASE WHEN slot->>'start' = :start AND slot->>'end' = :end
+                THEN jsonb_set(slot, '{available}', to_jsonb((slot->>'available')::int + :delta))
+                ELSE slot
+            END
+            ORDER BY position
+        )
+        FROM jsonb_array_elements(time_slots::jsonb) WITH ORDINALITY AS slots(slot, position)
+    )::json
+    WHERE id = :event_id
+      AND EXISTS (
+        SELECT 1
+        FROM jsonb_array_elements(time_slots::jsonb) AS slot
+        WHERE slot->>'start' = :start
+          AND slot->>'end' = :end
+          AND (slot->>'available')::int + :delta >= 0
+      )
+""")
+
+
+def _adjust_time_slot(db: Session, event_id, start: str, end: str, delta: int) -> bool:
+    """Atomically add delta to a time slot's availability"""
+    result = db.execute(
+        _ADJUST_TIME_SLOT_SQL,
+        {"event_id": event_id, "start": start, "end": end, "delta": delta}
+    )
+    return result.rowcount > 0
+
+
+def _adjust_available_slots(db: Session, event_id, delta: int) -> bool:
+    """Atomically add delta to an event's available slots"""
+    result = db.execute(
+        update(Event)
+        .where(Event.id == event_id, Event.available_slots + delta >= 0)
+        .values(available_slots=Event.available_slots + delta)
+    )
+    return result.rowcount > 0
+
+
+def _parse_hhmm(value: str) -> dt_time:
+    """Parse an "HH:MM" slot time (much cheaper than strptime)"""
+    return dt_time(int(value[:2]), int(value[3:5]))
+
+
+def _find_slot(time_slots: list, start: str, end: str):
+    """Look up a time slot by its start/end strings"""
+    slots_by_key = {(slot['start'], slot['end']): slot for slot in time_slots}
+    return slots_by_key.get((start, end))
+
+
+def _send_after_response(background_tasks: BackgroundTasks, send, *args, **kwargs):
+    """Queue an SMS to go out after the response, or send it now without background tasks"""
+    if background_tasks is not None:
+        background_tasks.add_task(send, *args, **kwargs)
+    else:
+        send(*args, **kwargs)
+
+
 def create_booking(
     db: Session,
     participant_id: str,
     participant_phone: str,
     event_id: str,
     time_slot_start: str = None,
-    time_slot_end: str = None
+    time_slot_end: str = None,
+    background_tasks: BackgroundTasks = None
 ) -> Booking:
-    """Create a new booking with time slot support"""
+    """
+    Create a new booking with time slot support.
+    The confirmation SMS goes out after the response when
+    background_tasks is given, otherwise inline.
+    """
+    
+    # Fetch the event and any active booking by this participant in one round trip
+    row = (
+        db.query(Event, Booking.id)
+        .outerjoin(Booking, and_(
+            Booking.event_id == Event.id,
+            Booking.participant_id == participant_id,
+            Booking.booking_status != "cancelled"
+        ))
+        .filter(Event.id == event_id)
+        .first()
+    )
     
     # Check if event exists
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
+    if not row:
         raise HTTPException(status_code=404, detail="Event not found")
     
-    # Check if already booked
-    existing = db.query(Booking).filter(
-        Booking.participant_id == participant_id,
-        Booking.event_id == event_id,
-        Booking.booking_status != "cancelled"
-    ).first()
+    event, existing_booking_id = row
     
-    if existing:
+    # Check if already booked
+    if existing_booking_id:
         raise HTTPException(
             status_code=400,
             detail="You have already booked this event"
@@ -57,43 +144,44 @@ def create_booking(
             )
         
         # Find the selected slot
-        selected_slot = None
-        for slot in event.time_slots:
-            if slot['start'] == time_slot_start and slot['end'] == time_slot_end:
-                selected_slot = slot
-                break
+        selected_slot = _find_slot(event.time_slots, time_slot_start, time_slot_end)
         
         if not selected_slot:
             raise HTTPException(status_code=400, detail="Invalid time slot selected")
         
-        if selected_slot['available'] <= 0:
+        # Claim the slot in the database so concurrent bookings can't oversell it
+        if not _adjust_time_slot(db, event.id, time_slot_start, time_slot_end, -1):
             raise HTTPException(status_code=400, detail="Selected time slot is full")
         
-        # Update slot availability
-        selected_slot['available'] -= 1
-        event.time_slots = event.time_slots  # Trigger SQLAlchemy update
-        
         # Convert time strings to time objects
-        slot_start_time = datetime.strptime(time_slot_start, "%H:%M").time()
-        slot_end_time = datetime.strptime(time_slot_end, "%H:%M").time()
+        slot_start_time = _parse_hhmm(time_slot_start)
+        slot_end_time = _parse_hhmm(time_slot_end)
     else:
-        # No time slots, check overall capacity
-        if event.available_slots <= 0:
+        # No time slots, claim a place from the overall capacity
+        if not _adjust_available_slots(db, event.id, -1):
             raise HTTPException(status_code=400, detail="Event is fully booked")
+    
+    # Create booking, drawing a new reference if one collides. The savepoint
+    # keeps the slot claimed above when only the insert is rolled back.
+    for attempt in range(BOOKING_REFERENCE_ATTEMPTS):
+        booking = Booking(
+            participant_id=participant_id,
+            event_id=event_id,
+            booking_reference=generate_booking_reference(),
+            booking_status="confirmed",
+            time_slot_start=slot_start_time,
+            time_slot_end=slot_end_time
+        )
         
-        event.available_slots -= 1
-    
-    # Create booking
-    booking = Booking(
-        participant_id=participant_id,
-        event_id=event_id,
-        booking_reference=generate_booking_reference(),
-        booking_status="confirmed",
-        time_slot_start=slot_start_time,
-        time_slot_end=slot_end_time
-    )
+        try:
+            with db.begin_nested():
+                db.add(booking)
+        except IntegrityError as e:
+            if attempt == BOOKING_REFERENCE_ATTEMPTS - 1 or not _is_reference_collision(e):
+                raise
+        else:
+            break
     
-    db.add(booking)
     db.commit()
     db.refresh(booking)
     
@@ -104,44 +192,64 @@ def create_booking(
         "time": f"{time_slot_start}-{time_slot_end}" if time_slot_start else str(event.event_time),
         "ref": booking.booking_reference
     }
-    send_booking_confirmation_sms(participant_phone, booking_details, mock=True)
+    _send_after_response(
+        background_tasks,
+        send_booking_confirmation_sms,
+        participant_phone,
+        booking_details,
+        mock=True
+    )
     
     return booking
 
 
-def cancel_booking(db: Session, booking_id: str, participant_phone: str) -> Booking:
-    """Cancel an existing booking"""
+def cancel_booking(
+    db: Session,
+    booking_id: str,
+    participant_phone: str,
+    background_tasks: BackgroundTasks = None
+) -> Booking:
+    """Cancel an existing booking (SMS is sent like in create_booking)"""
     
     booking = db.query(Booking).filter(Booking.id == booking_id).first()
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
     
-    if booking.booking_status == "cancelled":
-        raise HTTPException(status_code=400, detail="Booking already cancelled")
+    # Update booking, only if it isn't already cancelled (guards double release)
+    cancelled = db.execute(
+        update(Booking)
+        .where(Booking.id == booking.id, Booking.booking_status != "cancelled")
+        .values(booking_status="cancelled", cancelled_at=datetime.utcnow())
+    )
     
-    # Update booking
-    booking.booking_status = "cancelled"
-    booking.cancelled_at = datetime.utcnow()
+    if cancelled.rowcount == 0:
+        raise HTTPException(status_code=400, detail="Booking already cancelled")
     
     # Release slot
     event = booking.event
     if event.time_slots and booking.time_slot_start and booking.time_slot_end:
         # Release time slot
-        for slot in event.time_slots:
-            start_str = booking.time_slot_start.strftime("%H:%M")
-            end_str = booking.time_slot_end.strftime("%H:%M")
-            if slot['start'] == start_str and slot['end'] == end_str:
-                slot['available'] += 1
-                break
-        event.time_slots = event.time_slots
+        _adjust_time_slot(
+            db,
+            event.id,
+            booking.time_slot_start.strftime("%H:%M"),
+            booking.time_slot_end.strftime("%H:%M"),
+            1
+        )
     else:
         # Release general slot
-        event.available_slots += 1
+        _adjust_available_slots(db, event.id, 1)
     
     db.commit()
     db.refresh(booking)
     
     # Send cancellation SMS
-    send_booking_cancellation_sms(participant_phone, booking.booking_reference, mock=True)
+    _send_after_response(
+        background_tasks,
+        send_booking_cancellation_sms,
+        participant_phone,
+        booking.booking_reference,
+        mock=True
+    )
     
     return booking
\ No newline at end of file
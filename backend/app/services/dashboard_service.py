@@ -0,0 +1,82 @@
+from typing import Optional, Union
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+# Application-wide key of the advisory lock held by the one process
+# that refreshes admin_dashboard_stats
+DASHBOARD_REFRESH_LOCK_KEY = 72420001
+
+
+def get_admin_dashboard_stats(db: Session, admin_id: str) -> dict:
+    """
+    Read precomputed dashboard statistics for an admin
+    from the admin_dashboard_stats materialized view.
+    
+    Admins created since the last refresh have no row yet
+    and get zero counts.
+    """
+    stats = db.execute(
+        text("""
+            SELECT active_events, total_participants, tests_completed, bookings_this_month
+            FROM admin_dashboard_stats
+            WHERE created_by = :admin_id
+        """),
+        {"admin_id": admin_id}
+    ).mappings().first()
+    
+    if not stats:
+        return {
+            "active_events": 0,
+            "total_participants": 0,
+            "tests_completed": 0,
+            "bookings_this_month": 0
+        }
+    
+    return dict(stats)
+
+
+def acquire_dashboard_refresh_lock(engine: Engine) -> Optional[Connection]:
+    """
+    Try to become the process that refreshes admin_dashboard_stats.
+    
+    Returns a connection holding a session-level advisory lock, or
+    None if another process (e.g. another Gunicorn worker) holds it.
+    The lock lives as long as that connection, so the caller keeps
+    it open and hands it to release_dashboard_refresh_lock when done.
+    """
+    conn = engine.connect()
+    try:
+        locked = conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"),
+            {"key": DASHBOARD_REFRESH_LOCK_KEY}
+        ).scalar()
+        conn.commit()
+    except Exception:
+        release_dashboard_refresh_lock(conn)
+        raise
+    
+    if not locked:
+        conn.close()
+        return None
+    
+    return conn
+
+
+def release_dashboard_refresh_lock(conn: Connection) -> None:
+    """
+    Give up the refresh lock. The connection is discarded rather than
+    returned to the pool, which would keep the lock held.
+    """
+    conn.invalidate()
+    conn.close()
+
+
+def refresh_dashboard_stats(db: Union[Session, Connection]) -> None:
+    """
+    Recompute the admin_dashboard_stats materialized view.
+    CONCURRENTLY keeps the view readable while it refreshes.
+    """
+    db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY admin_dashboard_stats"))
+    db.commit()
@@ -0,0 +1,66 @@
+import json
+from typing import Dict, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models.event import Event
+from app.utils.cache import cache
+
+# Event details rarely change and are invalidated on edit/delete
+EVENT_CACHE_TTL = 3600
+
+
+def _event_key(event_id) -> str:
+    return f"event:{UUID(str(event_id))}"
+
+
+def get_or_cache_events(db: Session, event_ids: Iterable) -> Dict[str, dict]:
+    """
+    Look up name, date, time and address for several events.
+    Events missing from Redis are loaded in a single query and cached.
+    
+    Returns a dict keyed by event id (as a string).
+    """
+    ids = list({str(event_id) for event_id in event_ids})
+    if not ids:
+        return {}
+    
+    events = {}
+    misses = []
+    for event_id, hit in zip(ids, cache.get_many([_event_key(i) for i in ids])):
+        if hit is not None:
+            events[event_id] = json.loads(hit)
+        else:
+            misses.append(event_id)
+    
+    if misses:
+        rows = db.query(
+            Event.id,
+            Event.name,
+            Event.event_date,
+            Event.event_time,
+            Event.address
+        ).filter(Event.id.in_(misses)).all()
+        
+        for row in rows:
+            event = {
+                "name": row.name,
+                "event_date": row.event_date.isoformat(),
+                "event_time": row.event_time.isoformat(),
+                "address": row.address
+            }
+            events[str(row.id)] = event
+            cache.set(_event_key(row.id), json.dumps(event), EVENT_CACHE_TTL)
+    
+    return events
+
+
+def get_or_cache_event(db: Session, event_id) -> Optional[dict]:
+    """Look up a single event's details (None if it doesn't exist)"""
+    return get_or_cache_events(db, [event_id]).get(str(event_id))
+
+
+def invalidate_event_cache(event_id) -> None:
+    """Drop the cached details for one event"""
+    cache.delete(_event_key(event_id))
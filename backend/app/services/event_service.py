@@ -1,7 +1,10 @@
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException, status
 from datetime import datetime
+from typing import Optional
+from uuid import UUID
 import requests
 import os
 
@@ -72,11 +75,38 @@ class EventService:
         return new_event
 
     # ---------------- LIST EVENTS ----------------
-    def list_events(self, published_only: bool = True) -> list[Event]:
+    def list_events(
+        self,
+        published_only: bool = True,
+        after_id: Optional[UUID] = None,
+        limit: Optional[int] = None
+    ) -> list[Event]:
+        """
+        List events ordered by date and time.
+        Pass the last event id of a page as `after_id` to fetch the next page (keyset pagination).
+        """
         query = self.db.query(Event)
         if published_only:
             query = query.filter(Event.status == EventStatus.published)
-        return query.order_by(Event.event_date.asc(), Event.event_time.asc()).all()
+
+        sort_key = tuple_(Event.event_date, Event.event_time, Event.id)
+        if after_id:
+            cursor = (
+                self.db.query(Event.event_date, Event.event_time, Event.id)
+                .filter(Event.id == after_id)
+                .first()
+            )
+            if not cursor:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid after_id cursor"
+                )
+            query = query.filter(sort_key > tuple_(*cursor))
+
+        query = query.order_by(Event.event_date.asc(), Event.event_time.asc(), Event.id.asc())
+        if limit:
+            query = query.limit(limit)
+        return query.all()
 
     # ---------------- GET EVENT BY ID ----------------
     def get_event_by_id(self, event_id: str) -> Event:
@@ -157,7 +187,7 @@ class EventService:
             )
 
         # 5. Validate total_slots
-        booked_slots = event.total_slots - event.available_slots
+        booked_slots = event.booked_slots
         if event_data.total_slots < booked_slots:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,7 +1,7 @@
 import cloudinary
 import cloudinary.uploader
 from app.config import settings
-from typing import Optional
+from typing import BinaryIO, Optional, Tuple
 from datetime import datetime, timedelta
 
 # Configure Cloudinary
@@ -12,41 +12,47 @@ cloudinary.config(
     secure=True
 )
 
+# Size of each chunk sent by upload_large; Cloudinary requires at least 5 MB
+UPLOAD_CHUNK_SIZE = 6 * 1024 * 1024
+
 
 class FileUploadService:
     """Service for uploading files to Cloudinary"""
     
     def upload_result_pdf(
         self,
-        file_content: bytes,
+        file: BinaryIO,
         booking_id: str,
         filename: str
-    ) -> str:
+    ) -> Tuple[str, str]:
         """
-        Upload PDF result to Cloudinary
+        Upload PDF result to Cloudinary in UPLOAD_CHUNK_SIZE chunks,
+        so only one chunk is held in memory at a time
         
         Args:
-            file_content: PDF file bytes
+            file: PDF file object (closed once the upload finishes)
             booking_id: Booking ID (for folder organization)
             filename: Original filename
             
         Returns:
-            Cloudinary URL of uploaded file
+            Tuple of (Cloudinary URL, Cloudinary public ID) of uploaded file
         """
         try:
             # Upload to Cloudinary with organized folder structure
-            upload_result = cloudinary.uploader.upload(
-                file_content,
+            upload_result = cloudinary.uploader.upload_large(
+                file,
+                filename=filename,
                 folder=f"test_results/{booking_id}",
                 resource_type="raw",  # For PDFs
                 public_id=filename.replace('.pdf', ''),
                 type="private",  # Not publicly accessible
-                overwrite=True
+                overwrite=True,
+                chunk_size=UPLOAD_CHUNK_SIZE
             )
             
             print(f"✅ File uploaded to Cloudinary: {upload_result['secure_url']}")
             
-            return upload_result['secure_url']
+            return upload_result['secure_url'], upload_result['public_id']
             
         except Exception as e:
             print(f"❌ Cloudinary upload failed: {e}")
@@ -3,18 +3,32 @@ from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from app.models import OTPCode
+from app.utils.cache import cache
+
+# Default OTP validity period in minutes
+DEFAULT_OTP_EXPIRY_MINUTES = 10
 
 # OTP GENERATION
 def generate_otp() -> str:
     """Generate 6-digit random OTP code"""
     return str(random.randint(100000, 999999))
 
-# OTP DATABASE OPERATIONS
+# OTP STORAGE
+# OTPs live in Redis (auto-expiring, single use) when it is configured,
+# and in the otp_codes table otherwise or if a Redis write fails.
+def _otp_key(phone_number: str, purpose: str) -> str:
+    return f"otp:{phone_number}:{purpose}"
+
+
+def _otp_attempts_key(phone_number: str, purpose: str) -> str:
+    return f"otp:{phone_number}:{purpose}:attempts"
+
+
 def create_otp_record(
     db: Session,
     phone_number: str,
     purpose: str,
-    expiry_minutes: int = 10
+    expiry_minutes: int = DEFAULT_OTP_EXPIRY_MINUTES
 ) -> OTPCode:
     """
     Create OTP record in database
@@ -26,7 +40,7 @@ def create_otp_record(
         expiry_minutes: OTP validity period (default 10 minutes)
     
     Returns:
-        Created OTPCode object
+        Created OTPCode object (not persisted when stored in Redis)
     """
     # Generate OTP
     otp_code = generate_otp()
@@ -44,6 +58,14 @@ def create_otp_record(
         attempts=0
     )
     
+    # Store in Redis; the record is then only returned, not saved
+    ttl = expiry_minutes * 60
+    if cache.set(_otp_key(phone_number, purpose), otp_code, ttl):
+        if cache.set(_otp_attempts_key(phone_number, purpose), 0, ttl):
+            return otp_record
+        # Don't leave a code behind without its attempts counter
+        cache.delete(_otp_key(phone_number, purpose))
+    
     db.add(otp_record)
     db.commit()
     db.refresh(otp_record)
@@ -74,6 +96,11 @@ def verify_otp(
     Raises:
         HTTPException: If OTP is invalid, expired, or max attempts exceeded
     """
+    # Check Redis first
+    stored_code = cache.get(_otp_key(phone_number, purpose))
+    if stored_code is not None:
+        return _verify_cached_otp(phone_number, otp_code, purpose, stored_code.decode(), max_attempts)
+    
     # Find the most recent OTP for this phone and purpose
     otp_record = db.query(OTPCode).filter(
         OTPCode.phone_number == phone_number,
@@ -127,6 +154,45 @@ def verify_otp(
     return True
 
 
+def _verify_cached_otp(
+    phone_number: str,
+    otp_code: str,
+    purpose: str,
+    stored_code: str,
+    max_attempts: int
+) -> bool:
+    """Redis counterpart of verify_otp; expiry is handled by the key TTL"""
+    # ttl only applies if the counter was missing, so it never lingers without expiry
+    attempts = cache.incr(
+        _otp_attempts_key(phone_number, purpose),
+        ttl=DEFAULT_OTP_EXPIRY_MINUTES * 60
+    ) or 1
+    
+    # Check max attempts
+    if attempts > max_attempts:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many attempts. Please request a new OTP."
+        )
+    
+    # Verify OTP code
+    if stored_code != otp_code:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid OTP. {max_attempts - attempts} attempts remaining."
+        )
+    
+    # Consume it; only the request that actually deletes the key succeeds
+    if not cache.delete(_otp_key(phone_number, purpose)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="OTP already used"
+        )
+    cache.delete(_otp_attempts_key(phone_number, purpose))
+    
+    return True
+
+
 def cleanup_expired_otps(db: Session) -> int:
     """
     Delete expired OTP codes from database
@@ -156,6 +222,10 @@ def invalidate_previous_otps(
     Returns:
         Number of invalidated OTPs
     """
+    # Drop the Redis copy; database rows may still exist from a Redis fallback
+    removed = cache.delete(_otp_key(phone_number, purpose))
+    cache.delete(_otp_attempts_key(phone_number, purpose))
+    
     updated = db.query(OTPCode).filter(
         OTPCode.phone_number == phone_number,
         OTPCode.purpose == purpose,
@@ -164,4 +234,4 @@ def invalidate_previous_otps(
     
     db.commit()
     
-    return updated
\ No newline at end of file
+    return removed + updated
\ No newline at end of file
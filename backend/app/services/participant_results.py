@@ -0,0 +1,89 @@
+from typing import List, Optional
+
+from pydantic import TypeAdapter
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.booking import Booking
+from app.models.test_result import TestResult
+from app.schemas.result import ParticipantResultResponse
+from app.services.event_cache import get_or_cache_events
+from app.utils.cache import cache
+
+# Prefetched result lists only need to survive until the results page loads
+PREFETCH_TTL = 60
+
+participant_result_list_adapter = TypeAdapter(List[ParticipantResultResponse])
+
+
+def _results_key(participant_id) -> str:
+    return f"prefetch:participant:{participant_id}:results"
+
+
+def list_participant_results(db: Session, participant_id) -> List[ParticipantResultResponse]:
+    """
+    Results for a participant's attended events; events without a
+    result whose file has finished uploading are listed as "Pending".
+    """
+    # One row per attended booking; results not (fully) uploaded come back as "Pending"
+    has_result = TestResult.upload_status == "uploaded"
+    rows = db.query(
+        case((has_result, TestResult.id), else_=Booking.id).label("id"),
+        Booking.event_id,
+        case((has_result, TestResult.result_category), else_="Pending").label("result_category"),
+        func.coalesce(has_result, False).label("result_available"),
+        case((has_result, TestResult.uploaded_at), else_=Booking.booked_at).label("uploaded_at")
+    ).outerjoin(
+        TestResult, TestResult.booking_id == Booking.id
+    ).filter(
+        Booking.participant_id == participant_id,
+        Booking.booking_status == "checked_in"  # Only attended events
+    ).all()
+    
+    # Event details come from the cache, falling back to one query for misses
+    events = get_or_cache_events(db, (row.event_id for row in rows))
+    
+    # Pydantic converts the UUIDs and dates itself
+    return participant_result_list_adapter.validate_python(
+        {
+            **row._mapping,
+            "event_name": events[str(row.event_id)]["name"],
+            "event_date": events[str(row.event_id)]["event_date"]
+        }
+        for row in rows
+    )
+
+
+def cache_participant_results(participant_id, results: List[ParticipantResultResponse]) -> None:
+    """Store a result list as ready-to-send JSON"""
+    cache.set(
+        _results_key(participant_id),
+        participant_result_list_adapter.dump_json(results),
+        PREFETCH_TTL
+    )
+
+
+def get_prefetched_results(participant_id) -> Optional[bytes]:
+    """JSON body of a cached result list, if there is one"""
+    return cache.get(_results_key(participant_id))
+
+
+def prefetch_participant_results(participant_id) -> None:
+    """
+    Background job (e.g. right after login): warm the cache for the
+    participant's results page. Opens its own session.
+    """
+    if not cache.enabled:
+        return
+    
+    db = SessionLocal()
+    try:
+        cache_participant_results(participant_id, list_participant_results(db, participant_id))
+    finally:
+        db.close()
+
+
+def invalidate_participant_results(participant_id) -> None:
+    """Drop a participant's cached result list"""
+    cache.delete(_results_key(participant_id))
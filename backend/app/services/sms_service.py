@@ -28,19 +28,24 @@ class TwilioSMSService:
             self.client = None
             self.from_number = "mock-number"
 
-    def send_sms(self, to: str, message: str) -> Optional[str]:
+    def send_sms(self, to: str, message: str, redacted_message: Optional[str] = None) -> Optional[str]:
         """
         Send a generic SMS message via Twilio or mock it.
+        When mocked, redacted_message (if given) is shown instead of the
+        message, which is then only logged at debug level.
         Returns message SID if sent successfully.
         """
         if self.mock:
+            shown = redacted_message or message
             print("=" * 60)
             print("[MOCK SMS]")
             print(f"To: {to}")
-            print(f"Message:\n{message}")
+            print(f"Message:\n{shown}")
             print("=" * 60)
             
-            logger.info(f"[MOCK SMS] To: {to} | Message: {message}")
+            logger.info(f"[MOCK SMS] To: {to} | Message: {shown}")
+            if redacted_message:
+                logger.debug(f"[MOCK SMS] To: {to} | Message: {message}")
             return "mock-sid"
 
         try:
@@ -61,7 +66,9 @@ def send_otp_sms(phone: str, otp_code: str, mock: bool = True):
     """Send OTP verification code via SMS"""
     sms_service = TwilioSMSService(mock=mock)
     message = f"Your verification code is: {otp_code}. It will expire in 10 minutes."
-    result = sms_service.send_sms(phone, message)
+    # Keep the code itself out of stdout and INFO logs
+    redacted = message.replace(otp_code, "******")
+    result = sms_service.send_sms(phone, message, redacted_message=redacted)
     return result
 
 
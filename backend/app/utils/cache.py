@@ -0,0 +1,178 @@
+import functools
+import json
+import logging
+from typing import List, Optional
+
+import redis
+from fastapi.encoders import jsonable_encoder
+
+logger = logging.getLogger(__name__)
+
+# Endpoint arguments that never form part of a cache key
+_UNCACHED_PARAMS = {"db", "current_admin", "current_user", "current_participant"}
+
+# Seconds to wait on Redis before giving up, so an unresponsive server fails open
+REDIS_SOCKET_TIMEOUT = 0.5
+
+
+class RedisCache:
+    """
+    Shared Redis connection pool used for response caching.
+    Every operation is a no-op when Redis is not configured, and
+    Redis errors are logged rather than failing the request.
+    """
+
+    def __init__(self):
+        self.client: Optional[redis.Redis] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.client is not None
+
+    def connect(self, url: str) -> None:
+        """Create the connection pool (called on app startup)"""
+        self.client = redis.Redis(connection_pool=redis.ConnectionPool.from_url(
+            url,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_timeout=REDIS_SOCKET_TIMEOUT
+        ))
+
+    def close(self) -> None:
+        """Release the connection pool (called on app shutdown)"""
+        if self.client is not None:
+            self.client.connection_pool.disconnect()
+            self.client = None
+
+    def get(self, key: str) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        try:
+            return self.client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Cache get failed for {key}: {e}")
+            return None
+
+    def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        if not self.enabled or not keys:
+            return [None] * len(keys)
+        try:
+            return self.client.mget(keys)
+        except redis.RedisError as e:
+            logger.warning(f"Cache get failed for {keys}: {e}")
+            return [None] * len(keys)
+
+    def set(self, key: str, value, ttl: int) -> bool:
+        """Returns True if the value was stored"""
+        if not self.enabled:
+            return False
+        try:
+            self.client.set(key, value, ex=ttl)
+            return True
+        except redis.RedisError as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+            return False
+
+    def incr(self, key: str, ttl: Optional[int] = None) -> Optional[int]:
+        """
+        Increment a counter (keeps its TTL); None without Redis.
+        If the increment created the key, ttl (when given) is applied to it.
+        """
+        if not self.enabled:
+            return None
+        try:
+            value = self.client.incr(key)
+            if ttl and value == 1:
+                self.client.expire(key, ttl)
+            return value
+        except redis.RedisError as e:
+            logger.warning(f"Cache incr failed for {key}: {e}")
+            return None
+
+    def acquire_lock(self, key: str, ttl: int) -> bool:
+        """
+        Set key only if it doesn't exist yet (SET NX EX).
+        Returns False if someone else holds it; always True without Redis.
+        """
+        if not self.enabled:
+            return True
+        try:
+            return bool(self.client.set(key, 1, nx=True, ex=ttl))
+        except redis.RedisError as e:
+            logger.warning(f"Cache lock failed for {key}: {e}")
+            return True
+
+    def delete(self, *keys: str) -> int:
+        """Returns the number of keys removed"""
+        if not self.enabled or not keys:
+            return 0
+        try:
+            return self.client.delete(*keys)
+        except redis.RedisError as e:
+            logger.warning(f"Cache delete failed for {keys}: {e}")
+            return 0
+
+
+# Create singleton instance
+cache = RedisCache()
+
+
+def _namespace(prefix: str, kwargs: dict) -> str:
+    """Cache namespace: prefix[:admin_id]"""
+    current_admin = kwargs.get("current_admin")
+    if current_admin is not None:
+        return f"{prefix}:{current_admin.id}"
+    return prefix
+
+
+def _version_key(namespace: str) -> str:
+    return f"{namespace}:version"
+
+
+def _build_key(namespace: str, version: int, endpoint: str, kwargs: dict) -> str:
+    """Key format: prefix[:admin_id]:v<version>:endpoint[:param=value...]"""
+    parts = [namespace, f"v{version}", endpoint]
+    parts.extend(
+        f"{name}={value}"
+        for name, value in sorted(kwargs.items())
+        if name not in _UNCACHED_PARAMS
+    )
+    return ":".join(parts)
+
+
+def cached(prefix: str, ttl: int):
+    """
+    Cache a GET endpoint's JSON response in Redis.
+    Responses are keyed by route, current admin (if any), query params
+    and the namespace's version, which invalidation bumps.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            namespace = _namespace(prefix, kwargs)
+            version = int(cache.get(_version_key(namespace)) or 0)
+            key = _build_key(namespace, version, func.__name__, kwargs)
+
+            hit = cache.get(key)
+            if hit is not None:
+                return json.loads(hit)
+
+            response = func(*args, **kwargs)
+            cache.set(key, json.dumps(jsonable_encoder(response)), ttl)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+# Invalidation bumps the namespace version (O(1)) instead of scanning for
+# keys; responses cached under older versions are never read again and
+# expire with their TTL
+def invalidate_events_cache() -> None:
+    """Drop cached event listings and time slots"""
+    cache.incr(_version_key("events"))
+
+
+def invalidate_dashboard_cache(admin_id) -> None:
+    """Drop cached dashboard responses for one admin"""
+    cache.incr(_version_key(f"dashboard:{admin_id}"))